@@ -0,0 +1,90 @@
+# ---------------------------------------------------------------------------
+# Production server profile: gunicorn managing uvicorn workers
+#
+#   gunicorn -c gunicorn.conf.py main:app                    (from backend/)
+#   gunicorn -c backend/gunicorn.conf.py backend.main:app    (from the repo root)
+#
+# The working directory is left alone, so relative paths such as the default
+# sqlite:///./cattery.db resolve where they did under the previous uvicorn
+# commands.
+#
+# Every setting can be overridden from the environment (see .env.example).
+# Graceful restarts:
+#   kill -HUP  <master>  start fresh workers, then drain and stop the old ones
+#   kill -USR2 <master>  then -TERM the old master, to deploy new code with
+#                        zero downtime (HUP re-forks the preloaded code)
+#   kill -TERM <master>  stop accepting, drain connections, run lifespan shutdown
+# ---------------------------------------------------------------------------
+import importlib
+import multiprocessing
+import os
+
+from uvicorn.workers import UvicornWorker
+
+
+def _available_cpus() -> int:
+    """CPUs this container may actually use (cgroup quota, then affinity, then count)."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, int(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", str(_available_cpus())))
+backlog = int(os.getenv("BACKLOG", "2048"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "0"))
+
+# Import the app once in the master: faster worker boots, shared copy-on-write
+# memory and one-off DB initialisation (see on_starting)
+preload_app = _env_bool("PRELOAD_APP", "true")
+
+# Peers whose X-Forwarded-* headers uvicorn honours (it then takes the client
+# address and scheme from them).  Only list real proxies: render.yaml and the
+# Dockerfile set "*" because Render and Railway terminate TLS at their edge.
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+# Trusting every peer makes uvicorn take the left-most, client-supplied
+# X-Forwarded-For entry as request.client.  The rate limiter only reads that
+# header itself when RATE_LIMIT_PROXY_HOPS is set, so anything else would let
+# a client pick a fresh address for every request.
+if forwarded_allow_ips.strip() == "*" and not int(os.getenv("RATE_LIMIT_PROXY_HOPS", "0")):
+    raise RuntimeError("FORWARDED_ALLOW_IPS=* requires RATE_LIMIT_PROXY_HOPS to count the proxies in front")
+
+accesslog = "-" if _env_bool("ACCESS_LOG", "false") else None
+errorlog = "-"
+
+
+class CatteryWorker(UvicornWorker):
+    # uvloop + httptools come with uvicorn[standard]; "auto" picks them when installed.
+    # Give open connections (e.g. SSE streams) a deadline short of gunicorn's hard
+    # kill so the app's lifespan shutdown still gets to drain its queues.
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "loop": "auto",
+        "http": "auto",
+        "timeout_graceful_shutdown": max(1, graceful_timeout - 10),
+    }
+
+
+worker_class = CatteryWorker
+
+
+def on_starting(server):
+    """Create tables and seed data once, before any worker exists."""
+    if preload_app:
+        module = importlib.import_module(server.app.app_uri.partition(":")[0])
+        module.init_database()
@@ -1,17 +1,32 @@
 import os
+import hmac
 import json
+import math
+import time
+import asyncio
 import logging
+import random
 import secrets
+import smtplib
+import sqlite3
+import sys
+import itertools
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta, timezone
 from contextlib import asynccontextmanager
+from email.message import EmailMessage
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from sqlalchemy import create_engine, Column, Integer, String, Text, Float, Boolean, DateTime
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from sqlalchemy import (
+    create_engine, func, inspect, text, update, Column, Integer, String, Text, Float, Boolean, DateTime, UniqueConstraint,
+)
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, ValidationError
 from typing import List, Optional
 
 import bcrypt
@@ -27,9 +42,19 @@ except ImportError:
     pass  # python-dotenv is optional; env vars can be set directly
 
 # Render provides postgres:// but SQLAlchemy requires postgresql://
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./cattery.db")
-if DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+def normalise_database_url(url: str) -> str:
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+DATABASE_URL = normalise_database_url(os.getenv("DATABASE_URL", "sqlite:///./cattery.db"))
+# Optional read replicas for public reads (comma-separated); writes always go to DATABASE_URL
+DATABASE_READ_URLS = [normalise_database_url(u.strip())
+                      for u in os.getenv("DATABASE_READ_URL", "").split(",") if u.strip()]
+READ_REPLICA_HEALTH_INTERVAL = float(os.getenv("READ_REPLICA_HEALTH_INTERVAL", "10"))
+# After a write, the same client reads from the primary for this long (replication lag allowance)
+READ_AFTER_WRITE_SECONDS = int(os.getenv("READ_AFTER_WRITE_SECONDS", "5"))
 SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_hex(32))
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
@@ -40,6 +65,64 @@ CORS_ORIGINS = os.getenv(
 DEFAULT_ADMIN_PASSWORD = os.getenv("DEFAULT_ADMIN_PASSWORD", "admin123")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
+# Write-behind mode for public waiting-list submissions (see WaitingListWriteBehind)
+WAITING_LIST_WRITE_BEHIND = os.getenv("WAITING_LIST_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+WAITING_LIST_JOURNAL = os.getenv("WAITING_LIST_JOURNAL", "./waiting_list_journal.db")
+WAITING_LIST_QUEUE_MAX = int(os.getenv("WAITING_LIST_QUEUE_MAX", "5000"))
+WAITING_LIST_BATCH_SIZE = int(os.getenv("WAITING_LIST_BATCH_SIZE", "200"))
+WAITING_LIST_FLUSH_INTERVAL = float(os.getenv("WAITING_LIST_FLUSH_INTERVAL", "0.5"))
+
+# In-process background jobs (see JobRunner)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_MAX_RETRIES = int(os.getenv("JOB_MAX_RETRIES", "3"))
+JOB_DRAIN_TIMEOUT = float(os.getenv("JOB_DRAIN_TIMEOUT", "10"))
+JOB_QUEUE_DB = os.getenv("JOB_QUEUE_DB", "")  # optional SQLite file; empty keeps jobs in memory only
+# Prerendered HTML for the public routes (see prerender_site); empty disables it
+PRERENDER_DIR = os.getenv("PRERENDER_DIR", "")
+
+# Per-client rate limits, "<requests>/<seconds>" (see RateLimitMiddleware)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+RATE_LIMIT_WAITING_LIST = os.getenv("RATE_LIMIT_WAITING_LIST", "5/60")
+RATE_LIMIT_LOGIN = os.getenv("RATE_LIMIT_LOGIN", "5/60")
+RATE_LIMIT_API = os.getenv("RATE_LIMIT_API", "120/60")
+# Number of reverse proxies in front of the app; 0 (direct connections) ignores X-Forwarded-For.
+# render.yaml and the Dockerfile (Railway) set 1.
+RATE_LIMIT_PROXY_HOPS = int(os.getenv("RATE_LIMIT_PROXY_HOPS", "0"))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "100000"))
+# Optional SQLite file so all workers on a host share the same buckets
+RATE_LIMIT_SHARED_DB = os.getenv("RATE_LIMIT_SHARED_DB", "")
+
+# Request profiling, toggled from the admin API (see RequestProfiler); these are the initial settings
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0.01"))
+PROFILE_SLOW_MS = float(os.getenv("PROFILE_SLOW_MS", "500"))
+PROFILE_DB = os.getenv("PROFILE_DB", "./profiles.db")  # settings + captured profiles, shared by workers
+PROFILE_MAX_ENTRIES = int(os.getenv("PROFILE_MAX_ENTRIES", "50"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+
+# Shared results for hot public reads (see SingleFlightCache)
+PUBLIC_CACHE_TTL = float(os.getenv("PUBLIC_CACHE_TTL", "10"))
+PUBLIC_CACHE_STALE_TTL = float(os.getenv("PUBLIC_CACHE_STALE_TTL", "60"))
+
+# How often each process checks the DB for page-content edits made by other processes
+CONTENT_REFRESH_SECONDS = float(os.getenv("CONTENT_REFRESH_SECONDS", "0"))
+
+# Server-Sent Events feed of kitten changes (see KittenEventBroadcaster)
+SSE_MAX_CLIENTS = int(os.getenv("SSE_MAX_CLIENTS", "5000"))
+SSE_CLIENT_BUFFER = int(os.getenv("SSE_CLIENT_BUFFER", "32"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "20"))
+SSE_MAX_STREAM_SECONDS = float(os.getenv("SSE_MAX_STREAM_SECONDS", "300"))
+# How often each worker checks the change log for kitten edits made by other workers
+SSE_POLL_SECONDS = float(os.getenv("SSE_POLL_SECONDS", "1"))
+
+# Outgoing email (waiting-list notifications); notifications are skipped when SMTP_HOST is unset
+SMTP_HOST = os.getenv("SMTP_HOST", "")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USERNAME = os.getenv("SMTP_USERNAME", "")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+SMTP_FROM = os.getenv("SMTP_FROM", "")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() in ("1", "true", "yes")
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -52,11 +135,26 @@ logger = logging.getLogger("cattery")
 # ---------------------------------------------------------------------------
 # Database setup
 # ---------------------------------------------------------------------------
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+def make_engine(url: str, **kwargs):
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    return create_engine(url, connect_args=connect_args, **kwargs)
+
+
+engine = make_engine(DATABASE_URL)
+read_engines = [make_engine(url, pool_pre_ping=True) for url in DATABASE_READ_URLS]
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _dispose_inherited_pools():
+    for e in [engine, *read_engines]:
+        e.dispose(close=False)
+
+
+# Pooled connections must not be shared with forked workers (gunicorn preload_app)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_inherited_pools)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -77,6 +175,7 @@ class Kitten(Base):
     image_url = Column(String)
     available = Column(Boolean, default=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    deleted_at = Column(DateTime, nullable=True)
 
 
 class WaitingList(Base):
@@ -109,6 +208,7 @@ class Parent(Base):
     description = Column(Text)
     image_url = Column(String)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    deleted_at = Column(DateTime, nullable=True)
 
 
 class Product(Base):
@@ -123,6 +223,28 @@ class Product(Base):
     stock_quantity = Column(Integer, default=0)
     available = Column(Boolean, default=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    deleted_at = Column(DateTime, nullable=True)
+
+
+class ChangeVersion(Base):
+    """Latest change-log version per catalog table (bumped in the writer's transaction)."""
+    __tablename__ = "change_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+    __table_args__ = (UniqueConstraint("table_name", "version"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False)
+    row_id = Column(Integer, nullable=False)
+    action = Column(String, nullable=False)  # "upsert" or "delete" (tombstone)
+    data = Column(Text)  # row as served by the API; NULL for tombstones
+    changed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
 
 class AdminSettings(Base):
@@ -205,6 +327,59 @@ class PageContentResponse(PageContentUpdate):
     model_config = ConfigDict(from_attributes=True)
     id: int
     updated_at: datetime
+    parsed: dict = {}
+
+
+# Typed page content – PageContent.content holds one of these as JSON.
+# Unknown keys are kept so the admin panel can add fields without a backend change.
+class ContentModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class HomeContent(ContentModel):
+    company_name: str = "Royal Abyssinians"
+    logo_url: str = "/images/aby_photo1.jpg"
+    tagline: str = ""
+    description: str = ""
+    affiliations: List[str] = []
+
+
+class CareContent(ContentModel):
+    title: str = ""
+    about_breed: str = ""
+    image_url: str = ""
+    care_tips: List[str] = []
+
+
+class ContactInfo(ContentModel):
+    email: str = ""
+    phone: str = ""
+    address: str = ""
+
+
+class AboutContent(ContentModel):
+    title: str = ""
+    description: str = ""
+    contact: ContactInfo = ContactInfo()
+    payment_methods: List[str] = []
+
+
+class SocialLink(ContentModel):
+    platform: str = ""
+    url: str = ""
+    icon: str = ""
+
+
+class SocialMediaContent(ContentModel):
+    links: List[SocialLink] = []
+
+
+PAGE_CONTENT_MODELS = {
+    "home": HomeContent,
+    "care": CareContent,
+    "about": AboutContent,
+    "social_media": SocialMediaContent,
+}
 
 
 class ParentCreate(BaseModel):
@@ -237,6 +412,10 @@ class ProductResponse(ProductCreate):
     created_at: datetime
 
 
+KITTEN_LIST = TypeAdapter(List[KittenResponse])
+PARENT_LIST = TypeAdapter(List[ParentResponse])
+
+
 class AdminLogin(BaseModel):
     password: str
 
@@ -246,6 +425,12 @@ class AdminPasswordChange(BaseModel):
     new_password: str
 
 
+class ProfilingSettings(BaseModel):
+    enabled: bool
+    sample_rate: float = Field(ge=0, le=1)
+    slow_ms: float = Field(ge=0)
+
+
 # ---------------------------------------------------------------------------
 # Dependency – DB session
 # ---------------------------------------------------------------------------
@@ -257,6 +442,122 @@ def get_db():
         db.close()
 
 
+# ---------------------------------------------------------------------------
+# Read replicas – public GETs use get_read_db, everything else stays on the primary
+# ---------------------------------------------------------------------------
+PRIMARY_PIN_COOKIE = "cattery_primary_until"
+
+
+class ReadReplicaRouter:
+    """Round-robin over read replica engines, skipping ones that failed a health check.
+
+    A replica is re-checked with ``SELECT 1`` at most every ``health_interval``
+    seconds, or straight away after a query on it failed.  When no replica
+    is healthy reads fall back to the primary.
+    """
+
+    def __init__(self, engines: list, health_interval: float):
+        self.health_interval = health_interval
+        self._replicas = [{"engine": e, "healthy": True, "checked_at": 0.0} for e in engines]
+        self._counter = itertools.count()
+
+    def _healthy(self, replica: dict) -> bool:
+        now = time.monotonic()
+        if now - replica["checked_at"] >= self.health_interval:
+            replica["checked_at"] = now
+            try:
+                with replica["engine"].connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                if not replica["healthy"]:
+                    logger.info("Read replica %s is back.", replica["engine"].url.render_as_string(hide_password=True))
+                replica["healthy"] = True
+            except Exception as e:
+                if replica["healthy"]:
+                    logger.warning("Read replica %s failed its health check: %s",
+                                   replica["engine"].url.render_as_string(hide_password=True), e)
+                replica["healthy"] = False
+        return replica["healthy"]
+
+    def pick(self):
+        """Return the next healthy replica engine, or None to use the primary."""
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[next(self._counter) % len(self._replicas)]
+            if self._healthy(replica):
+                return replica["engine"]
+        return None
+
+    def mark_down(self, failed_engine):
+        for replica in self._replicas:
+            if replica["engine"] is failed_engine:
+                replica["healthy"] = False
+                replica["checked_at"] = 0.0
+
+
+read_router = ReadReplicaRouter(read_engines, READ_REPLICA_HEALTH_INTERVAL)
+
+
+def _pin_signature(until: str) -> str:
+    return hmac.new(SECRET_KEY.encode(), f"{PRIMARY_PIN_COOKIE}:{until}".encode(), "sha256").hexdigest()
+
+
+def primary_pin_value(seconds: int) -> str:
+    """Cookie value pinning a client to the primary for ``seconds``: "<until>.<HMAC>"."""
+    until = f"{time.time() + seconds:.0f}"
+    return f"{until}.{_pin_signature(until)}"
+
+
+def pinned_to_primary(request: Request) -> bool:
+    """True for a pin cookie we issued that hasn't expired; forged or far-future values are ignored."""
+    until, _, signature = request.cookies.get(PRIMARY_PIN_COOKIE, "").partition(".")
+    if not until.isdigit() or not hmac.compare_digest(signature, _pin_signature(until)):
+        return False
+    now = time.time()
+    return now < int(until) <= now + READ_AFTER_WRITE_SECONDS + 1
+
+
+def open_read_session(pin_primary: bool = False) -> tuple:
+    """Return (session, replica engine or None) for a read-only unit of work."""
+    replica = None if pin_primary or not read_engines else read_router.pick()
+    db = SessionLocal(bind=replica) if replica is not None else SessionLocal()
+    return db, replica
+
+
+def get_read_db(request: Request):
+    db, replica = open_read_session(pinned_to_primary(request))
+    try:
+        yield db
+    except OperationalError:
+        if replica is not None:
+            read_router.mark_down(replica)
+        raise
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware:
+    """Set a short-lived cookie after every successful write so that client's reads hit the primary."""
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, app, seconds: int):
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in self.SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (f"{PRIMARY_PIN_COOKIE}={primary_pin_value(self.seconds)}; "
+                          f"Max-Age={self.seconds}; Path=/; HttpOnly; SameSite=Lax")
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
+
+
 # ---------------------------------------------------------------------------
 # Auth dependency – require valid JWT on protected endpoints
 # ---------------------------------------------------------------------------
@@ -271,6 +572,164 @@ def require_admin(credentials: HTTPAuthorizationCredentials = Depends(bearer_sch
     verify_token(credentials.credentials)
 
 
+# ---------------------------------------------------------------------------
+# Page content snapshot (decoded once, shared by the API and the SEO renderer)
+# ---------------------------------------------------------------------------
+def parse_page_content(page_name: str, raw: str) -> ContentModel:
+    """Validate a page's JSON content; raises ValidationError if it is malformed."""
+    return PAGE_CONTENT_MODELS.get(page_name, ContentModel).model_validate_json(raw)
+
+
+class ContentSnapshot:
+    """In-memory, versioned copy of every PageContent row with its decoded model.
+
+    The stamp is the ``page_content`` version from the change log, which every
+    edit bumps in its own transaction, so it only ever moves forward.  Readers
+    compare it with the stamp the snapshot was loaded at and reload if another
+    process changed something; with the default ``refresh_seconds`` of 0 that
+    happens on every read, so an edit is visible from every worker at once
+    and only the decoding is saved.  ``update_page_content`` reloads straight
+    after its commit (the table holds a handful of rows).  Only a newer stamp
+    triggers a reload, so checking against a lagging read replica never rolls
+    the snapshot back.  ``version`` increases on every reload so derived
+    caches can be keyed on it.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.version = 0
+        self._pages: dict = {}  # page_name -> (PageContentResponse, ContentModel)
+        self._stamp = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _db_stamp(db: Session) -> int:
+        return db.query(ChangeVersion.version).filter(ChangeVersion.table_name == "page_content").scalar() or 0
+
+    @staticmethod
+    def _entry(row: PageContent) -> tuple:
+        try:
+            model = parse_page_content(row.page_name, row.content)
+        except ValidationError:
+            logger.error("Stored content for page %r is invalid; serving defaults.", row.page_name)
+            model = PAGE_CONTENT_MODELS.get(row.page_name, ContentModel)()
+        response = PageContentResponse(id=row.id, page_name=row.page_name, content=row.content,
+                                       updated_at=row.updated_at, parsed=model.model_dump())
+        return response, model
+
+    def load(self, db: Session):
+        with self._lock:
+            self._stamp = self._db_stamp(db)  # read first: the pages can only be as new or newer
+            self._pages = {row.page_name: self._entry(row) for row in db.query(PageContent)}
+            self._checked_at = time.monotonic()
+            self.version += 1
+
+    def ensure_fresh(self, db: Session):
+        if time.monotonic() - self._checked_at < self.refresh_seconds:
+            return
+        self._checked_at = time.monotonic()
+        if self._stamp is None or self._db_stamp(db) > self._stamp:
+            self.load(db)
+
+    def get(self, db: Session, page_name: str) -> Optional[PageContentResponse]:
+        self.ensure_fresh(db)
+        entry = self._pages.get(page_name)
+        return entry[0] if entry else None
+
+    def model(self, db: Session, page_name: str) -> ContentModel:
+        self.ensure_fresh(db)
+        entry = self._pages.get(page_name)
+        return entry[1] if entry else PAGE_CONTENT_MODELS.get(page_name, ContentModel)()
+
+
+content_snapshot = ContentSnapshot(CONTENT_REFRESH_SECONDS)
+
+
+# ---------------------------------------------------------------------------
+# Change log – soft deletes and per-table versions for incremental sync
+# ---------------------------------------------------------------------------
+# table -> (model, response schema); each entry's data is the row as its GET endpoint serves it
+CHANGE_TABLES = {
+    "kittens": (Kitten, KittenResponse),
+    "parents": (Parent, ParentResponse),
+    "products": (Product, ProductResponse),
+    "page_content": (PageContent, PageContentResponse),
+}
+SOFT_DELETE_MODELS = (Kitten, Parent, Product)
+
+
+def record_change(db: Session, row, action: str = "upsert"):
+    """Append ``row`` to the change log inside the caller's transaction.
+
+    The version comes from an UPDATE of the table's counter row, which holds
+    that row's lock until commit, so concurrent writers to one table are
+    serialised and versions become visible in order with no gaps.  The row
+    is flushed and re-read first, so new rows have their id and the logged
+    data carries the values (and naive timestamps) the database hands back.
+    """
+    table = row.__tablename__
+    db.flush()
+    db.refresh(row)
+    version = db.execute(
+        update(ChangeVersion)
+        .where(ChangeVersion.table_name == table)
+        .values(version=ChangeVersion.version + 1)
+        .returning(ChangeVersion.version)
+    ).scalar_one()
+    data = None
+    if isinstance(row, PageContent):
+        data = ContentSnapshot._entry(row)[0].model_dump_json()  # includes ``parsed``, like GET /api/content
+    elif action != "delete":
+        data = CHANGE_TABLES[table][1].model_validate(row).model_dump_json()
+    db.add(ChangeLog(table_name=table, version=version, row_id=row.id, action=action, data=data))
+
+
+def soft_delete(db: Session, row):
+    row.deleted_at = datetime.now(timezone.utc)
+    record_change(db, row, "delete")
+
+
+def add_soft_delete_columns():
+    """create_all() doesn't alter existing tables; add deleted_at to catalogs created before it existed."""
+    inspector = inspect(engine)
+    for table in (model.__tablename__ for model in SOFT_DELETE_MODELS):
+        if "deleted_at" not in {column["name"] for column in inspector.get_columns(table)}:
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN deleted_at TIMESTAMP"))
+            logger.info("Added %s.deleted_at.", table)
+
+
+def init_change_log(db: Session):
+    """Start each table's log with an upsert per existing row, so since=0 is a full sync."""
+    for table, (model, _) in CHANGE_TABLES.items():
+        if db.get(ChangeVersion, table) is not None:
+            continue
+        db.add(ChangeVersion(table_name=table, version=0))
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()  # another worker got here first
+            continue
+        query = db.query(model)
+        if model in SOFT_DELETE_MODELS:
+            query = query.filter(model.deleted_at.is_(None))
+        for row in query.order_by(model.id):
+            record_change(db, row)
+        db.commit()
+
+
+def parse_change_cursor(since: str) -> dict:
+    """'kittens:12,parents:4' -> {"kittens": 12, "parents": 4, "products": 0, "page_content": 0}."""
+    cursor = dict.fromkeys(CHANGE_TABLES, 0)
+    for part in filter(None, (p.strip() for p in since.split(","))):
+        table, _, version = part.partition(":")
+        if table not in CHANGE_TABLES or not version.isdigit():
+            raise HTTPException(status_code=400, detail=f"Invalid since cursor: {part!r}")
+        cursor[table] = int(version)
+    return cursor
+
+
 # ---------------------------------------------------------------------------
 # Seed / initialisation helpers
 # ---------------------------------------------------------------------------
@@ -362,33 +821,1044 @@ def init_admin_password(db: Session):
 
 
 # ---------------------------------------------------------------------------
-# Application lifespan (replaces deprecated on_event)
+# Local SQLite files (journals / queues kept next to the app, not in the main DB)
 # ---------------------------------------------------------------------------
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Startup
+def open_local_sqlite(path: str) -> sqlite3.Connection:
+    """Open an autocommit SQLite connection in WAL mode, safe to share across processes."""
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=FULL")
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Waiting list write-behind (optional, WAITING_LIST_WRITE_BEHIND=true)
+# ---------------------------------------------------------------------------
+class WaitingListWriteBehind:
+    """Journal public waiting-list submissions and group-commit them in batches.
+
+    Each submission is appended to a local SQLite journal (one row per email)
+    and acknowledged straight away.  The journal runs with synchronous=NORMAL:
+    in WAL mode a commit then survives a process crash without an fsync per
+    submission (only a power loss can drop the last few), so a burst of
+    signups doesn't queue up behind the disk.  A background task claims
+    batches from the journal, inserts them into ``WaitingList`` with a single
+    commit and only then deletes them from the journal, so accepted entries
+    survive a crash and are replayed on the next start.
+
+    Every worker shares the journal and any of them may flush another's rows,
+    so the backpressure count is re-read from the journal on each flush tick
+    and only this process's inserts are added to it in between.
+    """
+
+    STALE_CLAIM_SECONDS = 60
+
+    def __init__(self, path: str, max_pending: int, batch_size: int, flush_interval: float):
+        self.path = path
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._flush_conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    def open(self):
+        self._write_conn = open_local_sqlite(self.path)
+        self._flush_conn = open_local_sqlite(self.path)
+        for conn in (self._write_conn, self._flush_conn):
+            conn.execute("PRAGMA synchronous=NORMAL")
+        self._write_conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " email TEXT NOT NULL UNIQUE,"
+            " payload TEXT NOT NULL,"
+            " enqueued_at REAL NOT NULL,"
+            " claimed_by TEXT,"
+            " claimed_at REAL)"
+        )
+        self._pending = self._count()
+        if self._pending:
+            logger.info("Replaying %d journalled waiting-list entries.", self._pending)
+
+    def close(self):
+        for conn in (self._write_conn, self._flush_conn):
+            if conn is not None:
+                conn.close()
+        self._write_conn = self._flush_conn = None
+
+    def _count(self) -> int:
+        return self._flush_conn.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+
+    def _sync_pending(self):
+        count = self._count()
+        with self._lock:
+            self._pending = count
+
+    def enqueue(self, entry: "WaitingListCreate") -> bool:
+        """Journal an entry. Returns False when the journal is full (caller should back off)."""
+        payload = entry.model_dump()
+        email = payload["email"].strip().lower()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                return False
+            self._pending += 1  # reserve a slot; the insert itself runs outside the lock
+        try:
+            cur = self._write_conn.execute(
+                "INSERT OR IGNORE INTO pending (email, payload, enqueued_at) VALUES (?, ?, ?)",
+                (email, json.dumps(payload), time.time()),
+            )
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        if cur.rowcount == 0:  # already journalled
+            with self._lock:
+                self._pending -= 1
+        return True
+
+    def flush(self) -> int:
+        """Move one batch from the journal into WaitingList. Returns the number of entries taken."""
+        conn = self._flush_conn
+        token = f"{os.getpid()}-{secrets.token_hex(8)}"
+        now = time.time()
+        conn.execute(
+            "UPDATE pending SET claimed_by = ?, claimed_at = ? WHERE id IN ("
+            " SELECT id FROM pending WHERE claimed_by IS NULL OR claimed_at < ?"
+            " ORDER BY id LIMIT ?)",
+            (token, now, now - self.STALE_CLAIM_SECONDS, self.batch_size),
+        )
+        rows = conn.execute("SELECT email, payload FROM pending WHERE claimed_by = ?", (token,)).fetchall()
+        if rows:
+            try:
+                self._commit_batch({email: json.loads(payload) for email, payload in rows})
+            except Exception:
+                conn.execute("UPDATE pending SET claimed_by = NULL, claimed_at = NULL WHERE claimed_by = ?", (token,))
+                raise
+            conn.execute("DELETE FROM pending WHERE claimed_by = ?", (token,))
+
+        self._sync_pending()
+        return len(rows)
+
+    def _commit_batch(self, entries: dict):
+        db = SessionLocal()
+        try:
+            lowered = func.lower(WaitingList.email)
+            existing = {email for (email,) in db.query(lowered).filter(lowered.in_(list(entries)))}
+            db.add_all(WaitingList(**data) for email, data in entries.items() if email not in existing)
+            db.commit()
+        finally:
+            db.close()
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                taken = await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Waiting-list flush failed; retrying.")
+                taken = 0
+            if taken < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def start(self):
+        self.open()
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background task and drain whatever is still journalled."""
+        self._stopping.set()
+        await self._task
+        try:
+            while await asyncio.to_thread(self.flush):
+                pass
+        except Exception:
+            logger.exception("Could not drain the waiting-list journal; it will be replayed on next start.")
+        self.close()
+
+
+waiting_list_writer = (
+    WaitingListWriteBehind(WAITING_LIST_JOURNAL, WAITING_LIST_QUEUE_MAX,
+                           WAITING_LIST_BATCH_SIZE, WAITING_LIST_FLUSH_INTERVAL)
+    if WAITING_LIST_WRITE_BEHIND else None
+)
+
+
+# ---------------------------------------------------------------------------
+# Background jobs (notifications, cache warming and other post-write work)
+# ---------------------------------------------------------------------------
+JOB_HANDLERS: dict = {}
+
+
+def job(name: str):
+    """Register a blocking function as a background job handler under ``name``."""
+    def register(fn):
+        JOB_HANDLERS[name] = fn
+        return fn
+    return register
+
+
+class JobRunner:
+    """In-process job queue: a pool of asyncio workers with retries and a shutdown drain.
+
+    Handlers are ordinary blocking functions (they open their own DB session)
+    and run in a thread, at most ``workers`` at a time.  ``enqueue`` is safe to
+    call from the sync request handlers in the threadpool.  Failed jobs are
+    retried with exponential backoff up to ``max_retries`` times; the drain
+    on shutdown also waits for jobs that are between attempts, and logs any
+    job it has to abandon.
+
+    With ``db_path`` set, jobs are also written to a local SQLite queue until
+    they finish, so work left over by a crash or by a drain that timed out is
+    picked up again on the next start.  Each sweep also refreshes the claim on
+    every job this process still holds, so only jobs whose owner has stopped
+    heartbeating for ``STALE_CLAIM_SECONDS`` are taken over, and a job is run
+    only while its row is still claimed by this process.
+    """
+
+    STALE_CLAIM_SECONDS = 600
+    SWEEP_INTERVAL = 60
+
+    def __init__(self, workers: int, max_retries: int, drain_timeout: float, db_path: str = ""):
+        self.workers = workers
+        self.max_retries = max_retries
+        self.drain_timeout = drain_timeout
+        self.db_path = db_path
+        self._token = ""  # set in start(), after any fork, so each worker has its own
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retries: dict = {}  # backoff task -> job waiting for its next attempt
+
+    # -- persistence -------------------------------------------------------
+    def _db(self, sql: str, params: tuple = ()):
+        with self._conn_lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _persist(self, name: str, payload: dict) -> Optional[int]:
+        if self._conn is None:
+            return None
+        with self._conn_lock:
+            cur = self._conn.execute(
+                "INSERT INTO jobs (name, payload, attempts, claimed_by, claimed_at) VALUES (?, ?, 0, ?, ?)",
+                (name, json.dumps(payload), self._token, time.time()),
+            )
+            return cur.lastrowid
+
+    def _claim_orphans(self) -> list:
+        """Heartbeat our own claims, then take over persisted jobs no running process is responsible for."""
+        now = time.time()
+        with self._conn_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("UPDATE jobs SET claimed_at = ? WHERE claimed_by = ?", (now, self._token))
+                rows = self._conn.execute(
+                    "SELECT id, name, payload, attempts FROM jobs"
+                    " WHERE (claimed_by IS NULL OR claimed_at < ?) AND claimed_by IS NOT ?",
+                    (now - self.STALE_CLAIM_SECONDS, self._token),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE jobs SET claimed_by = ?, claimed_at = ? WHERE id = ?",
+                    [(self._token, now, row[0]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return rows
+
+    def _still_ours(self, job_id: Optional[int]) -> bool:
+        """False if the job was finished or taken over by another process since we queued it."""
+        if job_id is None or self._conn is None:
+            return True
+        rows = self._db("SELECT claimed_by FROM jobs WHERE id = ?", (job_id,))
+        return bool(rows) and rows[0][0] == self._token
+
+    def _record_attempt(self, job_id: Optional[int], attempts: int):
+        if job_id is not None and self._conn is not None:
+            self._db("UPDATE jobs SET attempts = ?, claimed_at = ? WHERE id = ?", (attempts, time.time(), job_id))
+
+    def _forget(self, job_id: Optional[int]):
+        if job_id is not None and self._conn is not None:
+            self._db("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    # -- queueing ----------------------------------------------------------
+    def enqueue(self, name: str, **payload):
+        """Schedule ``JOB_HANDLERS[name](**payload)``; payload values must be JSON-serialisable."""
+        if name not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job: {name}")
+        if self._loop is None:
+            # Runner not started (e.g. app used without lifespan): do the work inline.
+            JOB_HANDLERS[name](**payload)
+            return
+        job_id = self._persist(name, payload)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (job_id, name, payload, 0))
+
+    async def _worker(self):
+        while True:
+            item = await self._queue.get()
+            try:
+                await self._execute(*item)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job_id: Optional[int], name: str, payload: dict, attempts: int):
+        if not await asyncio.to_thread(self._still_ours, job_id):
+            logger.info("Job %s (%s) is no longer claimed by this process; skipping.", job_id, name)
+            return
+        try:
+            await asyncio.to_thread(JOB_HANDLERS[name], **payload)
+        except Exception:
+            attempts += 1
+            if attempts > self.max_retries:
+                logger.exception("Job %s failed after %d attempts; giving up.", name, attempts)
+                await asyncio.to_thread(self._forget, job_id)
+                return
+            delay = min(2 ** attempts, 60)
+            logger.warning("Job %s failed (attempt %d); retrying in %ds.", name, attempts, delay, exc_info=True)
+            await asyncio.to_thread(self._record_attempt, job_id, attempts)
+            item = (job_id, name, payload, attempts)
+            task = asyncio.create_task(self._retry_later(delay, item))
+            self._retries[task] = item
+            return
+        await asyncio.to_thread(self._forget, job_id)
+
+    async def _retry_later(self, delay: float, item: tuple):
+        try:
+            await asyncio.sleep(delay)
+            self._queue.put_nowait(item)
+        finally:
+            self._retries.pop(asyncio.current_task(), None)
+
+    async def _sweep(self):
+        while True:
+            for job_id, name, payload, attempts in await asyncio.to_thread(self._claim_orphans):
+                if name in JOB_HANDLERS:
+                    self._queue.put_nowait((job_id, name, json.loads(payload), attempts))
+            await asyncio.sleep(self.SWEEP_INTERVAL)
+
+    # -- lifecycle ---------------------------------------------------------
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._token = f"{os.getpid()}-{secrets.token_hex(8)}"
+        if self.db_path:
+            self._conn = open_local_sqlite(self.db_path)
+            self._db(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " name TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " claimed_by TEXT,"
+                " claimed_at REAL)"
+            )
+            self._tasks.append(asyncio.create_task(self._sweep()))
+        self._tasks.extend(asyncio.create_task(self._worker()) for _ in range(self.workers))
+
+    async def _drain(self):
+        while True:
+            await self._queue.join()
+            if not self._retries:
+                return
+            await asyncio.wait(list(self._retries))  # each puts its job back on the queue
+
+    async def stop(self):
+        """Let queued and retrying jobs finish (up to ``drain_timeout`` seconds), then stop the workers."""
+        try:
+            await asyncio.wait_for(self._drain(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Background jobs still pending after %.0fs; abandoning drain.", self.drain_timeout)
+        abandoned = list(self._retries.values())
+        while not self._queue.empty():
+            abandoned.append(self._queue.get_nowait())
+        for task in [*self._tasks, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks = []
+        self._retries = {}
+        for job_id, name, _, attempts in abandoned:
+            if job_id is None:
+                logger.warning("Job %s dropped at shutdown after %d attempt(s).", name, attempts)
+            else:
+                logger.warning("Job %s (%s) not run before shutdown; left in the job queue.", job_id, name)
+        if self._conn is not None:
+            # Hand unfinished jobs back so the next process to start picks them up.
+            self._db("UPDATE jobs SET claimed_by = NULL WHERE claimed_by = ?", (self._token,))
+            self._conn.close()
+            self._conn = None
+        self._loop = None
+
+
+jobs = JobRunner(JOB_WORKERS, JOB_MAX_RETRIES, JOB_DRAIN_TIMEOUT, JOB_QUEUE_DB)
+
+
+# ---------------------------------------------------------------------------
+# Live kitten updates (Server-Sent Events)
+# ---------------------------------------------------------------------------
+class KittenEventBroadcaster:
+    """Push kitten changes to every SSE client connected to this worker process.
+
+    The kittens change log (see record_change) is the channel between
+    processes: each worker with connected clients polls it every
+    ``poll_seconds`` and turns new entries into events, and the worker that
+    made a change is poked to poll straight away.  Event ids are change-log versions, so they mean the same
+    thing on every worker and a browser reconnecting with ``Last-Event-ID``
+    is replayed from the log wherever it lands.
+
+    Each client owns a small bounded queue, so an idle connection costs one
+    suspended coroutine and nothing else; a single heartbeat task keeps all
+    connections alive and closes streams older than ``max_stream_seconds``
+    (browsers reconnect on their own, which also rebalances clients across
+    workers).  A client that falls ``client_buffer`` events behind, or asks
+    to replay more than that, gets one ``resync`` event telling it to refetch.
+    """
+
+    RESYNC = "event: resync\ndata: {}\n\n"
+    POLL_BATCH = 100
+
+    def __init__(self, max_clients: int, client_buffer: int, heartbeat_seconds: float,
+                 max_stream_seconds: float, poll_seconds: float):
+        self.max_clients = max_clients
+        self.client_buffer = client_buffer
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_stream_seconds = max_stream_seconds
+        self.poll_seconds = poll_seconds
+        self._version: Optional[int] = None  # last change-log version dispatched
+        self._clients: dict = {}  # queue -> deadline (loop time)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def poke(self):
+        """Poll the change log now rather than on the next tick; safe to call from request threads."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    # -- change log --------------------------------------------------------
+    @staticmethod
+    def _head() -> int:
+        db = SessionLocal()
+        try:
+            return db.query(ChangeVersion.version).filter(ChangeVersion.table_name == "kittens").scalar() or 0
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load_events(after: int, limit: int) -> list:
+        """(version, message) pairs for kitten changes after ``after``, oldest first."""
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(ChangeLog)
+                .filter(ChangeLog.table_name == "kittens", ChangeLog.version > after)
+                .order_by(ChangeLog.version)
+                .limit(limit)
+                .all()
+            )
+            # Each row's latest entry before the batch, in one query; later ones come from the batch itself
+            latest = (
+                db.query(ChangeLog.row_id, func.max(ChangeLog.version).label("version"))
+                .filter(ChangeLog.table_name == "kittens", ChangeLog.version <= after,
+                        ChangeLog.row_id.in_({row.row_id for row in rows}))
+                .group_by(ChangeLog.row_id)
+                .subquery()
+            )
+            previous = dict(
+                db.query(ChangeLog.row_id, ChangeLog.data)
+                .join(latest, (ChangeLog.row_id == latest.c.row_id) & (ChangeLog.version == latest.c.version))
+                .filter(ChangeLog.table_name == "kittens")
+            ) if rows else {}
+            events = []
+            for row in rows:
+                before = previous.get(row.row_id)
+                previous[row.row_id] = row.data
+                if row.action == "delete":
+                    events.append((row.version, "kitten.deleted", json.dumps({"id": row.row_id})))
+                    continue
+                if before is None:
+                    events.append((row.version, "kitten.created", row.data))
+                    continue
+                events.append((row.version, "kitten.updated", row.data))
+                available = json.loads(row.data)["available"]
+                if json.loads(before)["available"] != available:
+                    events.append((row.version, "kitten.availability",
+                                   json.dumps({"id": row.row_id, "available": available})))
+            return [(version, f"id: {version}\nevent: {event}\ndata: {data}\n\n") for version, event, data in events]
+        finally:
+            db.close()
+
+    async def _poll(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._clients:
+                self._version = None  # nobody to tell; re-read the head when a client connects
+                continue
+            try:
+                if self._version is None:
+                    head = await asyncio.to_thread(self._head)
+                    if self._version is None:
+                        self._version = head
+                    continue
+                while True:
+                    events = await asyncio.to_thread(self._load_events, self._version, self.POLL_BATCH)
+                    for version, message in events:
+                        self._version = version
+                        for queue in self._clients:
+                            self._offer(queue, message)
+                    if len(events) < self.POLL_BATCH:
+                        break
+            except Exception as exc:
+                logger.warning("Polling the kitten change log failed: %s", exc)
+
+    # -- clients -----------------------------------------------------------
+    def _offer(self, queue: asyncio.Queue, message: Optional[str]):
+        if queue.full():
+            while not queue.empty():
+                queue.get_nowait()
+            message = self.RESYNC if message is not None else None
+        queue.put_nowait(message)
+
+    async def _replay(self, last_event_id: Optional[str], upto: Optional[int]) -> List[str]:
+        if not last_event_id:
+            return []
+        if not last_event_id.isdigit() or upto is None:
+            return [self.RESYNC]
+        events = await asyncio.to_thread(self._load_events, int(last_event_id), self.client_buffer + 1)
+        events = [message for version, message in events if version <= upto]
+        return [self.RESYNC] if len(events) > self.client_buffer else events
+
+    async def stream(self, last_event_id: Optional[str] = None):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.client_buffer)
+        if self._version is None:
+            head = await asyncio.to_thread(self._head)
+            if self._version is None:
+                self._version = head
+        # Registering and noting the version together: anything newer arrives through the queue
+        self._clients[queue] = self._loop.time() + self.max_stream_seconds
+        upto = self._version
+        try:
+            yield "retry: 3000\n\n"
+            for message in await self._replay(last_event_id, upto):
+                yield message
+            while True:
+                message = await queue.get()
+                if message is None:
+                    break
+                yield message
+        finally:
+            self._clients.pop(queue, None)
+
+    async def _beat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            now = self._loop.time()
+            for queue, deadline in list(self._clients.items()):
+                self._offer(queue, ": keep-alive\n\n" if deadline > now else None)
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._beat()), asyncio.create_task(self._poll())]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for queue in list(self._clients):
+            self._offer(queue, None)
+        self._loop = None
+
+
+kitten_events = KittenEventBroadcaster(SSE_MAX_CLIENTS, SSE_CLIENT_BUFFER, SSE_HEARTBEAT_SECONDS,
+                                       SSE_MAX_STREAM_SECONDS, SSE_POLL_SECONDS)
+
+
+_database_initialised = False
+
+
+def init_database():
+    """Create tables and seed defaults.
+
+    Under gunicorn with preload_app this runs once in the master before the
+    workers fork (see gunicorn.conf.py); workers inherit the flag and skip it.
+    """
+    global _database_initialised
     Base.metadata.create_all(bind=engine)
+    add_soft_delete_columns()
     logger.info("Database tables created / verified.")
 
     db = SessionLocal()
     try:
         init_default_content(db)
         init_admin_password(db)
+        init_change_log(db)
+    finally:
+        db.close()
+    _database_initialised = True
+
+
+# ---------------------------------------------------------------------------
+# Application lifespan (replaces deprecated on_event)
+# ---------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup
+    if not _database_initialised:
+        init_database()
+
+    db = SessionLocal()
+    try:
+        content_snapshot.load(db)
+        # A new deploy may ship a new index.html (new asset hashes): rebuild the snapshot first
+        prerender_site(db)
     finally:
         db.close()
+    if waiting_list_writer is not None:
+        await waiting_list_writer.start()
+    await jobs.start()
+    await kitten_events.start()
+    await request_profiler.start()
     logger.info("Startup initialisation complete.")
 
     yield  # Application runs
 
     # Shutdown
+    await request_profiler.stop()
+    await kitten_events.stop()
+    await jobs.stop()
+    if waiting_list_writer is not None:
+        await waiting_list_writer.stop()
     logger.info("Shutting down.")
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting (token buckets per route and client IP)
+# ---------------------------------------------------------------------------
+def parse_rate(spec: str) -> tuple:
+    """'5/60' -> (capacity 5, refill 5/60 tokens per second)."""
+    count, _, seconds = spec.partition("/")
+    capacity = float(count)
+    return capacity, capacity / float(seconds or 1)
+
+
+def _refill(tokens: float, last: float, now: float, capacity: float, rate: float) -> float:
+    return min(capacity, tokens + (now - last) * rate)
+
+
+class MemoryTokenBuckets:
+    """Token buckets for one process, LRU-bounded to ``max_keys`` clients."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()  # key -> (tokens, last)
+
+    async def take(self, key: tuple, capacity: float, rate: float) -> float:
+        """Spend one token. Returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        tokens, last = self._buckets.pop(key, (capacity, now))
+        tokens = _refill(tokens, last, now, capacity, rate)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+        self._buckets[key] = (tokens - 1 if wait == 0 else tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class SqliteTokenBuckets:
+    """Token buckets in a local SQLite file, shared by every worker process on the host."""
+
+    PRUNE_EVERY = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid = 0
+        self._lock = threading.Lock()
+        self._ops = 0
+
+    def _db(self) -> sqlite3.Connection:
+        # Opened lazily so a preloaded app doesn't share one connection across forked workers
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = open_local_sqlite(self.path)
+            conn.execute("PRAGMA synchronous=OFF")  # losing a few buckets on power loss is fine
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, last REAL NOT NULL)"
+            )
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def _take(self, key: str, capacity: float, rate: float) -> float:
+        now = time.time()
+        with self._lock:
+            conn = self._db()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT tokens, last FROM buckets WHERE key = ?", (key,)).fetchone()
+                tokens = _refill(*row, now, capacity, rate) if row else capacity
+                wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+                conn.execute("INSERT OR REPLACE INTO buckets (key, tokens, last) VALUES (?, ?, ?)",
+                             (key, tokens - 1 if wait == 0 else tokens, now))
+                self._ops += 1
+                if self._ops % self.PRUNE_EVERY == 0:
+                    # A bucket untouched for an hour is full again; forget it
+                    conn.execute("DELETE FROM buckets WHERE last < ?", (now - 3600,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    async def take(self, key: tuple, capacity: float, rate: float) -> float:
+        return await asyncio.to_thread(self._take, "|".join(key), capacity, rate)
+
+
+class RateLimitMiddleware:
+    """Reject over-limit requests with 429 before routing, DB access or bcrypt.
+
+    ``rules`` are ``(method, path, prefix_match, name, "<requests>/<seconds>")``;
+    the first matching rule applies and each (rule, client IP) pair gets its
+    own bucket.  Behind ``proxy_hops`` trusted proxies the client IP is taken
+    from that position counting from the right of X-Forwarded-For, since
+    anything further left is supplied by the client.  Without proxy hops it
+    is the connection's peer, which the server only rewrites for peers listed
+    in FORWARDED_ALLOW_IPS (gunicorn.conf.py refuses "*" in that case).
+    """
+
+    def __init__(self, app, rules: list, store, proxy_hops: int):
+        self.app = app
+        self.rules = [(method, path, prefix, name, *parse_rate(spec)) for method, path, prefix, name, spec in rules]
+        self.store = store
+        self.proxy_hops = proxy_hops
+
+    def _client_ip(self, scope) -> str:
+        if self.proxy_hops:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    hops = [h.strip() for h in value.decode("latin-1").split(",") if h.strip()]
+                    if hops:
+                        return hops[-min(self.proxy_hops, len(hops))]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _match(self, method: str, path: str):
+        for rule in self.rules:
+            rule_method, rule_path, prefix = rule[:3]
+            if (rule_method is None or rule_method == method) and \
+                    (path.startswith(rule_path) if prefix else path == rule_path):
+                return rule
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        rule = self._match(scope["method"], scope["path"])
+        if rule is not None:
+            name, capacity, rate = rule[3:]
+            wait = await self.store.take((name, self._client_ip(scope)), capacity, rate)
+            if wait:
+                response = JSONResponse(status_code=429, content={"detail": "Too many requests, please slow down"},
+                                        headers={"Retry-After": str(math.ceil(wait))})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+RATE_LIMIT_RULES = [
+    ("POST", "/api/waiting-list", False, "waiting-list", RATE_LIMIT_WAITING_LIST),
+    ("POST", "/api/admin/login", False, "login", RATE_LIMIT_LOGIN),
+    ("POST", "/api/admin/change-password", False, "login", RATE_LIMIT_LOGIN),
+    (None, "/api/", True, "api", RATE_LIMIT_API),
+]
+
+
+# ---------------------------------------------------------------------------
+# Request profiling (statistical stack sampler, opt-in from the admin API)
+# ---------------------------------------------------------------------------
+_PROFILED_CODE = tuple(
+    os.path.dirname(path) + os.sep for path in (__file__, sys.modules["fastapi"].__file__, sys.modules["starlette"].__file__)
+)
+
+
+def _collapse_stack(frame) -> Optional[str]:
+    """Root-first ``fn (file:line);...`` for one thread, or None if it isn't running request code.
+
+    Threads parked in the event loop's selector or waiting for threadpool work
+    never have app/framework frames on their stack, so they are left out.
+    """
+    names = []
+    busy = False
+    while frame is not None:
+        code = frame.f_code
+        busy = busy or code.co_filename.startswith(_PROFILED_CODE)
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names)) if busy else None
+
+
+class StackSampler:
+    """Samples every thread's Python stack while at least one profiled request is in flight.
+
+    Sync handlers run on threadpool threads that can't be tied back to the
+    request that scheduled them, so a profile is process-wide: it holds every
+    busy thread's stack in the worker for the duration of the request, and
+    the sampler thread sleeps whenever nothing is being profiled.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._active: dict = {}  # id(counter) -> Counter of collapsed stacks
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self) -> Counter:
+        stacks = Counter()
+        with self._lock:
+            self._active[id(stacks)] = stacks
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+            self._wake.set()
+        return stacks
+
+    def end(self, stacks: Counter):
+        with self._lock:
+            self._active.pop(id(stacks), None)
+
+    def _run(self):
+        me = threading.get_ident()
+        while True:
+            self._wake.wait()
+            frames = sys._current_frames()
+            busy = [stack for ident, frame in frames.items() if ident != me
+                    for stack in (_collapse_stack(frame),) if stack is not None]
+            del frames
+            with self._lock:
+                if not self._active:
+                    self._wake.clear()
+                    continue
+                # Under the lock so a request that has already ended is never written to
+                for stacks in self._active.values():
+                    stacks.update(busy)
+            time.sleep(self.interval)
+
+
+class RequestProfiler:
+    """Settings and a bounded ring of captured profiles in a local SQLite file.
+
+    The file is shared by all worker processes on the host, so toggling
+    profiling from the admin panel reaches every worker and any worker can
+    serve a download.  A lifespan task re-reads the settings once a second in
+    a thread; requests only look at ``settings``.  The file is created only
+    when profiling starts enabled (PROFILE_ENABLED) or the admin API is used.
+    """
+
+    SETTINGS_INTERVAL = 1.0
+
+    def __init__(self, path: str, defaults: ProfilingSettings, max_entries: int, interval: float):
+        self.path = path
+        self.max_entries = max_entries
+        self.sampler = StackSampler(interval)
+        self.settings = defaults
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid = 0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _db(self) -> sqlite3.Connection:
+        # Opened lazily so a preloaded app doesn't share one connection across forked workers
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = open_local_sqlite(self.path)
+            conn.execute("PRAGMA synchronous=NORMAL")  # losing the last profile on power loss is fine
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS settings (id INTEGER PRIMARY KEY CHECK (id = 1), "
+                "enabled INTEGER NOT NULL, sample_rate REAL NOT NULL, slow_ms REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "created REAL NOT NULL, pid INTEGER NOT NULL, method TEXT NOT NULL, path TEXT NOT NULL, "
+                "status INTEGER, duration_ms REAL NOT NULL, samples INTEGER NOT NULL, "
+                "overlapping INTEGER NOT NULL, stacks TEXT NOT NULL)"
+            )
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def _in_use(self) -> bool:
+        return (self._conn is not None and self._conn_pid == os.getpid()) or os.path.exists(self.path)
+
+    def load_settings(self) -> ProfilingSettings:
+        """Re-read the shared settings (blocking); keeps the current ones if the file doesn't exist."""
+        if self._in_use():
+            with self._lock:
+                row = self._db().execute("SELECT enabled, sample_rate, slow_ms FROM settings WHERE id = 1").fetchone()
+            if row is not None:
+                self.settings = ProfilingSettings(enabled=bool(row[0]), sample_rate=row[1], slow_ms=row[2])
+        return self.settings
+
+    async def _poll_settings(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.load_settings)
+            except sqlite3.Error as exc:
+                logger.warning("Could not read profiling settings: %s", exc)
+            await asyncio.sleep(self.SETTINGS_INTERVAL)
+
+    async def start(self):
+        self._task = asyncio.create_task(self._poll_settings())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def update_settings(self, settings: ProfilingSettings) -> ProfilingSettings:
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO settings (id, enabled, sample_rate, slow_ms) VALUES (1, ?, ?, ?)",
+                (int(settings.enabled), settings.sample_rate, settings.slow_ms),
+            )
+        self.settings = settings
+        return settings
+
+    def save(self, method: str, path: str, status_code: Optional[int], duration_ms: float,
+             stacks: Counter, overlapping: int):
+        folded = "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+        with self._lock:
+            conn = self._db()
+            cur = conn.execute(
+                "INSERT INTO profiles (created, pid, method, path, status, duration_ms, samples, overlapping, stacks) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), os.getpid(), method, path, status_code, round(duration_ms, 1),
+                 sum(stacks.values()), overlapping, folded),
+            )
+            conn.execute("DELETE FROM profiles WHERE id <= ?", (cur.lastrowid - self.max_entries,))
+
+    def recent(self) -> list:
+        if not self._in_use():
+            return []
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT id, created, pid, method, path, status, duration_ms, samples, overlapping "
+                "FROM profiles ORDER BY id DESC"
+            ).fetchall()
+        keys = ("id", "created", "pid", "method", "path", "status", "duration_ms", "samples", "overlapping")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stacks(self, profile_id: int) -> Optional[str]:
+        if not self._in_use():
+            return None
+        with self._lock:
+            row = self._db().execute("SELECT stacks FROM profiles WHERE id = ?", (profile_id,)).fetchone()
+        return row[0] if row else None
+
+
+class ProfilingMiddleware:
+    """Capture folded stacks for a random ``sample_rate`` of requests and for any slower than ``slow_ms``.
+
+    While profiling is disabled a request costs one attribute lookup.
+    Slow-request capture has to sample every request, since which ones will
+    be slow isn't known until they finish; only those over the threshold are
+    stored.  Profiles are process-wide (see StackSampler), so each records in
+    ``overlapping`` how many other requests this worker handled during it;
+    with 0 the stacks are this request's alone.  Long-lived streams and the
+    profiling endpoints are skipped.
+    """
+
+    SKIP_PATHS = ("/api/kittens/events", "/api/admin/profil")
+
+    def __init__(self, app, profiler: RequestProfiler):
+        self.app = app
+        self.profiler = profiler
+        self._in_flight = 0
+        self._capturing: dict = {}  # id -> [other requests seen], touched only on the event loop
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        settings = self.profiler.settings
+        if not settings.enabled or scope["path"].startswith(self.SKIP_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        self._in_flight += 1
+        for overlapping in self._capturing.values():
+            overlapping[0] += 1
+        try:
+            sampled = random.random() < settings.sample_rate
+            if not sampled and not settings.slow_ms:
+                await self.app(scope, receive, send)
+                return
+            await self._capture(scope, receive, send, settings, sampled)
+        finally:
+            self._in_flight -= 1
+
+    async def _capture(self, scope, receive, send, settings: ProfilingSettings, sampled: bool):
+        status_code = None
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        overlapping = [self._in_flight - 1]
+        self._capturing[id(overlapping)] = overlapping
+        stacks = self.profiler.sampler.begin()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.profiler.sampler.end(stacks)
+            del self._capturing[id(overlapping)]
+            duration_ms = (time.perf_counter() - started) * 1000
+            if stacks and (sampled or (settings.slow_ms and duration_ms >= settings.slow_ms)):
+                try:
+                    await asyncio.to_thread(self.profiler.save, scope["method"], scope["path"], status_code,
+                                            duration_ms, stacks, overlapping[0])
+                except sqlite3.Error as exc:
+                    logger.warning("Could not store request profile: %s", exc)
+
+
+request_profiler = RequestProfiler(
+    PROFILE_DB,
+    ProfilingSettings(enabled=PROFILE_ENABLED, sample_rate=PROFILE_SAMPLE_RATE, slow_ms=PROFILE_SLOW_MS),
+    PROFILE_MAX_ENTRIES,
+    PROFILE_INTERVAL_MS / 1000,
+)
+
+
 # ---------------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------------
 app = FastAPI(title="Abyssinian Cat Breeder API", lifespan=lifespan)
 
+# Added before CORS so 429 responses still carry CORS headers
+if RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=RATE_LIMIT_RULES,
+        store=SqliteTokenBuckets(RATE_LIMIT_SHARED_DB) if RATE_LIMIT_SHARED_DB
+        else MemoryTokenBuckets(RATE_LIMIT_MAX_CLIENTS),
+        proxy_hops=RATE_LIMIT_PROXY_HOPS,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
@@ -397,6 +1867,12 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],
 )
 
+if read_engines:
+    app.add_middleware(ReadYourWritesMiddleware, seconds=READ_AFTER_WRITE_SECONDS)
+
+# Outermost, so a profile covers the whole request including the other middleware
+app.add_middleware(ProfilingMiddleware, profiler=request_profiler)
+
 # Mount static files for images
 images_path = os.path.join(os.path.dirname(__file__), "..", "images")
 if os.path.exists(images_path):
@@ -412,29 +1888,177 @@ if os.path.isdir(frontend_build):
 
 
 # ---------------------------------------------------------------------------
-# API Endpoints — Public
+# Request coalescing for hot public reads
 # ---------------------------------------------------------------------------
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[Exception] = None
+
+
+class SingleFlightCache:
+    """Per-process result cache where concurrent misses for a key share one computation.
+
+    A value is fresh for ``ttl`` seconds and may then be served stale for
+    ``stale_ttl`` more while a single background thread recomputes it
+    (stale-while-revalidate).  A caller with nothing usable to serve waits
+    for the computation already in flight rather than starting its own, so a
+    cold start or expiry under load costs one DB query per key, not one per
+    request.  Keys are tuples whose first item is a namespace for
+    ``invalidate``; at most ``max_entries`` values are kept.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: dict = {}   # key -> (value, fresh_until, stale_until)
+        self._flights: dict = {}   # key -> _Flight
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, compute, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now < entry[1]:
+                return entry[0]
+            flight = self._flights.get(key)
+            if entry and now < entry[2]:
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                    threading.Thread(target=self._fly, args=(key, compute, ttl, flight, True), daemon=True).start()
+                return entry[0]
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if leader:
+            self._fly(key, compute, ttl, flight)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _fly(self, key: tuple, compute, ttl: float, flight: _Flight, background: bool = False):
+        try:
+            flight.value = compute()
+        except Exception as e:
+            flight.error = e
+            if background:
+                # Nobody is waiting on a background refresh; keep serving the stale value
+                logger.warning("Refreshing cached %r failed: %s", key, e)
+        finally:
+            with self._lock:
+                # An invalidate() while we were computing has already dropped our flight
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                    if flight.error is None:
+                        now = time.monotonic()
+                        self._entries.pop(key, None)
+                        self._entries[key] = (flight.value, now + ttl, now + ttl + self.stale_ttl)
+                        while len(self._entries) > self.max_entries:
+                            del self._entries[next(iter(self._entries))]
+            flight.done.set()
+
+    def invalidate(self, namespace: str):
+        """Drop every value (and in-flight computation) under ``namespace``."""
+        with self._lock:
+            for store in (self._entries, self._flights):
+                for key in [k for k in store if k[0] == namespace]:
+                    del store[key]
+
+
+public_cache = SingleFlightCache(PUBLIC_CACHE_TTL, PUBLIC_CACHE_STALE_TTL)
 
-# Kittens
-@app.get("/api/kittens", response_model=List[KittenResponse])
-def get_kittens(available_only: bool = False, db: Session = Depends(get_db)):
-    query = db.query(Kitten)
+
+# ---------------------------------------------------------------------------
+# Catalog queries shared by the API and the prerenderer
+# ---------------------------------------------------------------------------
+def query_kittens(db: Session, available_only: bool = False) -> list:
+    query = db.query(Kitten).filter(Kitten.deleted_at.is_(None))
     if available_only:
         query = query.filter(Kitten.available == True)
     return query.all()
 
 
+def query_parents(db: Session) -> list:
+    return db.query(Parent).filter(Parent.deleted_at.is_(None)).all()
+
+
+def cached_catalog_json(db: Session, namespace: str, query, adapter: TypeAdapter, *args) -> bytes:
+    """Serialised JSON for a public catalog list, shared through ``public_cache``.
+
+    Keyed on the table's change-log version as seen through ``db``, so a write
+    made through any worker is a cache miss everywhere on the next request
+    rather than after the TTL.  Misses are computed on the same database that
+    supplied the version (a replica, or the primary for pinned clients); it
+    can only have moved forward since, and data at least as new as the key is
+    always safe to serve under it.
+    """
+    version = db.query(ChangeVersion.version).filter(ChangeVersion.table_name == namespace).scalar()
+    db.commit()  # hand the connection back before possibly waiting on another request's flight
+    bind = db.get_bind()
+
+    def compute():
+        session = SessionLocal(bind=bind)  # own session: a stale refresh outlives the request's
+        try:
+            return adapter.dump_json(adapter.validate_python(query(session, *args), from_attributes=True))
+        except OperationalError:
+            if bind in read_engines:
+                read_router.mark_down(bind)
+            raise
+        finally:
+            session.close()
+    return public_cache.get((namespace, version, *args), compute)
+
+
+# ---------------------------------------------------------------------------
+# API Endpoints — Public
+# ---------------------------------------------------------------------------
+
+# Kittens
+@app.get("/api/kittens", response_model=List[KittenResponse])
+def get_kittens(available_only: bool = False, db: Session = Depends(get_read_db)):
+    body = cached_catalog_json(db, "kittens", query_kittens, KITTEN_LIST, available_only)
+    return Response(content=body, media_type="application/json")
+
+
+# Registered before /api/kittens/{kitten_id} so "events" is not parsed as an id
+@app.get("/api/kittens/events")
+async def kitten_event_stream(request: Request):
+    """Server-Sent Events: kitten.created / kitten.updated / kitten.deleted / kitten.availability."""
+    if kitten_events.client_count >= kitten_events.max_clients:
+        raise HTTPException(status_code=503, detail="Too many live connections", headers={"Retry-After": "30"})
+    return StreamingResponse(
+        kitten_events.stream(request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/kittens/{kitten_id}", response_model=KittenResponse)
-def get_kitten(kitten_id: int, db: Session = Depends(get_db)):
-    kitten = db.query(Kitten).filter(Kitten.id == kitten_id).first()
+def get_kitten(kitten_id: int, db: Session = Depends(get_read_db)):
+    kitten = db.query(Kitten).filter(Kitten.id == kitten_id, Kitten.deleted_at.is_(None)).first()
     if not kitten:
         raise HTTPException(status_code=404, detail="Kitten not found")
     return kitten
 
 
 # Waiting List (public submission)
-@app.post("/api/waiting-list", response_model=WaitingListResponse)
+@app.post("/api/waiting-list", response_model=WaitingListResponse,
+          responses={202: {"description": "Entry accepted for write-behind"}})
 def add_to_waiting_list(entry: WaitingListCreate, db: Session = Depends(get_db)):
+    if waiting_list_writer is not None:
+        if not waiting_list_writer.enqueue(entry):
+            raise HTTPException(status_code=503, detail="Waiting list is busy, please try again shortly",
+                                headers={"Retry-After": "5"})
+        return JSONResponse(status_code=202, content={"message": "Waiting list entry received", "status": "queued"})
+
     db_entry = WaitingList(**entry.model_dump())
     db.add(db_entry)
     db.commit()
@@ -444,8 +2068,8 @@ def add_to_waiting_list(entry: WaitingListCreate, db: Session = Depends(get_db))
 
 # Page Content (public read)
 @app.get("/api/content/{page_name}", response_model=PageContentResponse)
-def get_page_content(page_name: str, db: Session = Depends(get_db)):
-    content = db.query(PageContent).filter(PageContent.page_name == page_name).first()
+def get_page_content(page_name: str, db: Session = Depends(get_read_db)):
+    content = content_snapshot.get(db, page_name)
     if not content:
         raise HTTPException(status_code=404, detail="Page content not found")
     return content
@@ -453,13 +2077,14 @@ def get_page_content(page_name: str, db: Session = Depends(get_db)):
 
 # Parents (public read)
 @app.get("/api/parents", response_model=List[ParentResponse])
-def get_parents(db: Session = Depends(get_db)):
-    return db.query(Parent).all()
+def get_parents(db: Session = Depends(get_read_db)):
+    body = cached_catalog_json(db, "parents", query_parents, PARENT_LIST)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/parents/{parent_id}", response_model=ParentResponse)
-def get_parent(parent_id: int, db: Session = Depends(get_db)):
-    parent = db.query(Parent).filter(Parent.id == parent_id).first()
+def get_parent(parent_id: int, db: Session = Depends(get_read_db)):
+    parent = db.query(Parent).filter(Parent.id == parent_id, Parent.deleted_at.is_(None)).first()
     if not parent:
         raise HTTPException(status_code=404, detail="Parent not found")
     return parent
@@ -467,8 +2092,8 @@ def get_parent(parent_id: int, db: Session = Depends(get_db)):
 
 # Products (public read)
 @app.get("/api/products", response_model=List[ProductResponse])
-def get_products(available_only: bool = False, category: Optional[str] = None, db: Session = Depends(get_db)):
-    query = db.query(Product)
+def get_products(available_only: bool = False, category: Optional[str] = None, db: Session = Depends(get_read_db)):
+    query = db.query(Product).filter(Product.deleted_at.is_(None))
     if available_only:
         query = query.filter(Product.available == True)
     if category:
@@ -477,8 +2102,8 @@ def get_products(available_only: bool = False, category: Optional[str] = None, d
 
 
 @app.get("/api/products/{product_id}", response_model=ProductResponse)
-def get_product(product_id: int, db: Session = Depends(get_db)):
-    product = db.query(Product).filter(Product.id == product_id).first()
+def get_product(product_id: int, db: Session = Depends(get_read_db)):
+    product = db.query(Product).filter(Product.id == product_id, Product.deleted_at.is_(None)).first()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
@@ -525,30 +2150,43 @@ def change_admin_password(password_change: AdminPasswordChange, db: Session = De
 def create_kitten(kitten: KittenCreate, db: Session = Depends(get_db)):
     db_kitten = Kitten(**kitten.model_dump())
     db.add(db_kitten)
+    record_change(db, db_kitten)
     db.commit()
     db.refresh(db_kitten)
+    kitten_events.poke()
+    public_cache.invalidate("kittens")
+    request_prerender()
+    if db_kitten.available:
+        jobs.enqueue("notify_waiting_list", kitten_id=db_kitten.id)
     return db_kitten
 
 
 @app.put("/api/kittens/{kitten_id}", response_model=KittenResponse, dependencies=[Depends(require_admin)])
 def update_kitten(kitten_id: int, kitten: KittenCreate, db: Session = Depends(get_db)):
-    db_kitten = db.query(Kitten).filter(Kitten.id == kitten_id).first()
+    db_kitten = db.query(Kitten).filter(Kitten.id == kitten_id, Kitten.deleted_at.is_(None)).first()
     if not db_kitten:
         raise HTTPException(status_code=404, detail="Kitten not found")
     for key, value in kitten.model_dump().items():
         setattr(db_kitten, key, value)
+    record_change(db, db_kitten)
     db.commit()
     db.refresh(db_kitten)
+    kitten_events.poke()
+    public_cache.invalidate("kittens")
+    request_prerender()
     return db_kitten
 
 
 @app.delete("/api/kittens/{kitten_id}", dependencies=[Depends(require_admin)])
 def delete_kitten(kitten_id: int, db: Session = Depends(get_db)):
-    db_kitten = db.query(Kitten).filter(Kitten.id == kitten_id).first()
+    db_kitten = db.query(Kitten).filter(Kitten.id == kitten_id, Kitten.deleted_at.is_(None)).first()
     if not db_kitten:
         raise HTTPException(status_code=404, detail="Kitten not found")
-    db.delete(db_kitten)
+    soft_delete(db, db_kitten)
     db.commit()
+    kitten_events.poke()
+    public_cache.invalidate("kittens")
+    request_prerender()
     return {"message": "Kitten deleted successfully"}
 
 
@@ -571,6 +2209,10 @@ def remove_from_waiting_list(entry_id: int, db: Session = Depends(get_db)):
 # Page Content (admin write)
 @app.put("/api/content", response_model=PageContentResponse, dependencies=[Depends(require_admin)])
 def update_page_content(content: PageContentUpdate, db: Session = Depends(get_db)):
+    try:
+        parse_page_content(content.page_name, content.content)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
     db_content = db.query(PageContent).filter(PageContent.page_name == content.page_name).first()
     if not db_content:
         db_content = PageContent(page_name=content.page_name, content=content.content)
@@ -578,9 +2220,12 @@ def update_page_content(content: PageContentUpdate, db: Session = Depends(get_db
     else:
         db_content.content = content.content
         db_content.updated_at = datetime.now(timezone.utc)
+    record_change(db, db_content)
     db.commit()
-    db.refresh(db_content)
-    return db_content
+    content_snapshot.load(db)
+    jobs.enqueue("warm_seo_cache")
+    request_prerender()
+    return content_snapshot.get(db, content.page_name)
 
 
 # Parents (admin write)
@@ -588,30 +2233,38 @@ def update_page_content(content: PageContentUpdate, db: Session = Depends(get_db
 def create_parent(parent: ParentCreate, db: Session = Depends(get_db)):
     db_parent = Parent(**parent.model_dump())
     db.add(db_parent)
+    record_change(db, db_parent)
     db.commit()
     db.refresh(db_parent)
+    public_cache.invalidate("parents")
+    request_prerender()
     return db_parent
 
 
 @app.put("/api/parents/{parent_id}", response_model=ParentResponse, dependencies=[Depends(require_admin)])
 def update_parent(parent_id: int, parent: ParentCreate, db: Session = Depends(get_db)):
-    db_parent = db.query(Parent).filter(Parent.id == parent_id).first()
+    db_parent = db.query(Parent).filter(Parent.id == parent_id, Parent.deleted_at.is_(None)).first()
     if not db_parent:
         raise HTTPException(status_code=404, detail="Parent not found")
     for key, value in parent.model_dump().items():
         setattr(db_parent, key, value)
+    record_change(db, db_parent)
     db.commit()
     db.refresh(db_parent)
+    public_cache.invalidate("parents")
+    request_prerender()
     return db_parent
 
 
 @app.delete("/api/parents/{parent_id}", dependencies=[Depends(require_admin)])
 def delete_parent(parent_id: int, db: Session = Depends(get_db)):
-    db_parent = db.query(Parent).filter(Parent.id == parent_id).first()
+    db_parent = db.query(Parent).filter(Parent.id == parent_id, Parent.deleted_at.is_(None)).first()
     if not db_parent:
         raise HTTPException(status_code=404, detail="Parent not found")
-    db.delete(db_parent)
+    soft_delete(db, db_parent)
     db.commit()
+    public_cache.invalidate("parents")
+    request_prerender()
     return {"message": "Parent deleted successfully"}
 
 
@@ -620,6 +2273,7 @@ def delete_parent(parent_id: int, db: Session = Depends(get_db)):
 def create_product(product: ProductCreate, db: Session = Depends(get_db)):
     db_product = Product(**product.model_dump())
     db.add(db_product)
+    record_change(db, db_product)
     db.commit()
     db.refresh(db_product)
     return db_product
@@ -627,11 +2281,12 @@ def create_product(product: ProductCreate, db: Session = Depends(get_db)):
 
 @app.put("/api/products/{product_id}", response_model=ProductResponse, dependencies=[Depends(require_admin)])
 def update_product(product_id: int, product: ProductCreate, db: Session = Depends(get_db)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+    db_product = db.query(Product).filter(Product.id == product_id, Product.deleted_at.is_(None)).first()
     if not db_product:
         raise HTTPException(status_code=404, detail="Product not found")
     for key, value in product.model_dump().items():
         setattr(db_product, key, value)
+    record_change(db, db_product)
     db.commit()
     db.refresh(db_product)
     return db_product
@@ -639,14 +2294,58 @@ def update_product(product_id: int, product: ProductCreate, db: Session = Depend
 
 @app.delete("/api/products/{product_id}", dependencies=[Depends(require_admin)])
 def delete_product(product_id: int, db: Session = Depends(get_db)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+    db_product = db.query(Product).filter(Product.id == product_id, Product.deleted_at.is_(None)).first()
     if not db_product:
         raise HTTPException(status_code=404, detail="Product not found")
-    db.delete(db_product)
+    soft_delete(db, db_product)
     db.commit()
     return {"message": "Product deleted successfully"}
 
 
+# ---------------------------------------------------------------------------
+# Change feed (public) – incremental sync for the frontend and caches
+# ---------------------------------------------------------------------------
+@app.get("/api/changes")
+def get_changes(since: str = "", limit: int = Query(500, ge=1, le=5000), db: Session = Depends(get_read_db)):
+    """Catalog and page-content changes after ``since`` (``kittens:12,page_content:3``; missing tables mean 0).
+
+    Each change carries the row as its GET endpoint serves it, or
+    ``data: null`` for a deletion.  Pass the returned ``cursor`` as the next
+    ``since``; ``has_more`` means at least one table had more than ``limit``
+    changes left.
+    """
+    cursor = parse_change_cursor(since)
+    changes = []
+    has_more = False
+    for table, after in cursor.items():
+        rows = (
+            db.query(ChangeLog)
+            .filter(ChangeLog.table_name == table, ChangeLog.version > after)
+            .order_by(ChangeLog.version)
+            .limit(limit + 1)
+            .all()
+        )
+        if len(rows) > limit:
+            rows, has_more = rows[:limit], True
+        for row in rows:
+            changes.append({
+                "table": table,
+                "version": row.version,
+                "id": row.row_id,
+                "action": row.action,
+                "data": json.loads(row.data) if row.data else None,
+                "changed_at": row.changed_at,
+            })
+        if rows:
+            cursor[table] = rows[-1].version
+    return {
+        "changes": changes,
+        "versions": cursor,
+        "cursor": ",".join(f"{table}:{version}" for table, version in cursor.items()),
+        "has_more": has_more,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Health / root
 # ---------------------------------------------------------------------------
@@ -664,30 +2363,24 @@ SITE_URL = os.getenv("SITE_URL", "https://royalabycattery.com")
 
 
 def build_seo_html(db: Session) -> tuple:
-    """Read admin-managed content from DB and return (json_ld, noscript) HTML."""
-    # Load content from database
-    home_row = db.query(PageContent).filter(PageContent.page_name == "home").first()
-    about_row = db.query(PageContent).filter(PageContent.page_name == "about").first()
-    social_row = db.query(PageContent).filter(PageContent.page_name == "social_media").first()
-
-    home = json.loads(home_row.content) if home_row else {}
-    about = json.loads(about_row.content) if about_row else {}
-    social = json.loads(social_row.content) if social_row else {}
-
-    company = home.get("company_name", "Royal Abyssinians")
-    tagline = home.get("tagline", "")
-    description = home.get("description", "")
-    affiliations = home.get("affiliations", [])
-    logo_url = home.get("logo_url", "/images/aby_photo1.jpg")
-
-    contact = about.get("contact", {})
-    email = contact.get("email", "")
-    phone = contact.get("phone", "")
-    address_str = contact.get("address", "")
-    payment_methods = about.get("payment_methods", [])
-
-    social_links = social.get("links", [])
-    same_as = json.dumps([l.get("url", "") for l in social_links if l.get("url")])
+    """Render admin-managed content and return (json_ld, meta, noscript) HTML."""
+    # Decoded content comes from the in-memory snapshot, not the DB
+    home = content_snapshot.model(db, "home")
+    about = content_snapshot.model(db, "about")
+    social = content_snapshot.model(db, "social_media")
+
+    company = home.company_name
+    tagline = home.tagline
+    description = home.description
+    affiliations = home.affiliations
+    logo_url = home.logo_url
+
+    email = about.contact.email
+    phone = about.contact.phone
+    address_str = about.contact.address
+    payment_methods = about.payment_methods
+
+    social_links = social.links
 
     # Parse address loosely: "Street, City, ST ZIP" format
     addr_parts = [p.strip() for p in address_str.split(",")]
@@ -723,7 +2416,7 @@ def build_seo_html(db: Session) -> tuple:
             "postalCode": zipcode,
             "addressCountry": "US"
         },
-        "sameAs": [l.get("url", "") for l in social_links if l.get("url")]
+        "sameAs": [l.url for l in social_links if l.url]
     }, indent=2)
 
     local_ld = json.dumps({
@@ -845,8 +2538,70 @@ def build_seo_html(db: Session) -> tuple:
     return json_ld_html, meta_html, noscript_html
 
 
-def serve_index_with_seo(db: Session):
-    """Read index.html template and inject dynamic SEO content."""
+# Rendered SEO fragments only change when page content is edited, so they are
+# cached per content snapshot version; concurrent first renders share one build.
+def get_seo_fragments(db: Session) -> tuple:
+    content_snapshot.ensure_fresh(db)
+    return public_cache.get(("seo", content_snapshot.version), lambda: build_seo_html(db), ttl=float("inf"))
+
+
+# ---------------------------------------------------------------------------
+# Background job handlers
+# ---------------------------------------------------------------------------
+@job("warm_seo_cache")
+def warm_seo_cache():
+    db = SessionLocal()
+    try:
+        get_seo_fragments(db)
+    finally:
+        db.close()
+
+
+@job("notify_waiting_list")
+def notify_waiting_list(kitten_id: int):
+    """Fan out one email job per waiting-list address for a newly listed kitten."""
+    if not SMTP_HOST:
+        logger.info("SMTP_HOST not set; skipping waiting-list notification for kitten %d.", kitten_id)
+        return
+    db = SessionLocal()
+    try:
+        kitten = db.query(Kitten).filter(Kitten.id == kitten_id, Kitten.deleted_at.is_(None)).first()
+        if not kitten or not kitten.available:
+            return
+        recipients = [email for (email,) in db.query(WaitingList.email).distinct()]
+        company = content_snapshot.model(db, "home").company_name
+    finally:
+        db.close()
+
+    subject = f"{company}: {kitten.name} is now available"
+    body = (
+        f"Good news! A new kitten has just been listed.\n\n"
+        f"{kitten.name} - {kitten.color} {kitten.gender}, born {kitten.birth_date}\n"
+        f"{kitten.description}\n\n"
+        f"See all available kittens at {SITE_URL}/kittens\n"
+    )
+    for email in recipients:
+        jobs.enqueue("send_email", to=email, subject=subject, body=body)
+    logger.info("Queued %d waiting-list notifications for kitten %d.", len(recipients), kitten_id)
+
+
+@job("send_email")
+def send_email(to: str, subject: str, body: str):
+    message = EmailMessage()
+    message["From"] = SMTP_FROM or SMTP_USERNAME
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30) as smtp:
+        if SMTP_STARTTLS:
+            smtp.starttls()
+        if SMTP_USERNAME:
+            smtp.login(SMTP_USERNAME, SMTP_PASSWORD)
+        smtp.send_message(message)
+
+
+def render_index_html(db: Session, initial_state: Optional[dict] = None) -> Optional[str]:
+    """Read index.html template and inject dynamic SEO content (and optional initial state)."""
     index_file = os.path.join(frontend_build, "index.html")
     if not os.path.isfile(index_file):
         return None
@@ -854,18 +2609,151 @@ def serve_index_with_seo(db: Session):
     with open(index_file, "r") as f:
         html = f.read()
 
-    json_ld_html, meta_html, noscript_html = build_seo_html(db)
+    json_ld_html, meta_html, noscript_html = get_seo_fragments(db)
 
     # Replace placeholders
     html = html.replace("<!-- DYNAMIC_STRUCTURED_DATA -->", json_ld_html)
     html = html.replace("<!-- DYNAMIC_META_TAGS -->", meta_html)
     html = html.replace("<!-- DYNAMIC_NOSCRIPT -->", noscript_html)
 
+    if initial_state is not None:
+        # Escape "<" so content can never close the script tag early
+        state_json = json.dumps(initial_state, default=str).replace("<", "\\u003c")
+        html = html.replace("</head>", f"  <script>window.__INITIAL_STATE__ = {state_json};</script>\n  </head>", 1)
+
+    return html
+
+
+def serve_index_with_seo(db: Session):
+    html = render_index_html(db)
+    if html is None:
+        return None
     return HTMLResponse(content=html)
 
 
+# ---------------------------------------------------------------------------
+# Prerendered snapshot of the public routes (optional, PRERENDER_DIR)
+# ---------------------------------------------------------------------------
+# SPA route -> file inside PRERENDER_DIR, and the data each page needs on first paint
+PRERENDER_ROUTES = {
+    "": ("index.html", ["home"], False),
+    "kittens": ("kittens/index.html", ["about"], True),
+    "care": ("care/index.html", ["care"], False),
+    "about": ("about/index.html", ["about"], False),
+}
+
+_prerender_lock = threading.Lock()
+
+
+def build_initial_state(db: Session, pages: List[str], with_catalog: bool) -> dict:
+    # social_media feeds the footer on every page
+    state = {"content": {page: content_snapshot.model(db, page).model_dump()
+                         for page in ["social_media", *pages]}}
+    if with_catalog:
+        state["kittens"] = [KittenResponse.model_validate(k).model_dump(mode="json") for k in query_kittens(db)]
+        state["parents"] = [ParentResponse.model_validate(p).model_dump(mode="json") for p in query_parents(db)]
+    return state
+
+
+def prerender_site(db: Optional[Session] = None) -> List[str]:
+    """Write fully rendered HTML for every public route into PRERENDER_DIR.
+
+    Each file is written to a temporary name and renamed into place, so
+    readers only ever see a complete old or new page.  Returns the files
+    written (empty when prerendering is disabled or there is no build).
+    """
+    if not PRERENDER_DIR:
+        return []
+    own_session = db is None
+    db = db or SessionLocal()
+    written = []
+    try:
+        with _prerender_lock:
+            for route, (filename, pages, with_catalog) in PRERENDER_ROUTES.items():
+                html = render_index_html(db, build_initial_state(db, pages, with_catalog))
+                if html is None:
+                    return []
+                target = os.path.join(PRERENDER_DIR, filename)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                tmp = f"{target}.{os.getpid()}.tmp"
+                with open(tmp, "w") as f:
+                    f.write(html)
+                os.replace(tmp, target)
+                written.append(target)
+    finally:
+        if own_session:
+            db.close()
+    logger.info("Prerendered %d pages into %s.", len(written), PRERENDER_DIR)
+    return written
+
+
+def request_prerender():
+    """Regenerate the snapshot in the background after an admin change."""
+    if PRERENDER_DIR:
+        jobs.enqueue("prerender_site")
+
+
+def prerendered_file(full_path: str) -> Optional[str]:
+    if not PRERENDER_DIR:
+        return None
+    entry = PRERENDER_ROUTES.get(full_path.strip("/"))
+    if entry is None:
+        return None
+    path = os.path.join(PRERENDER_DIR, entry[0])
+    return path if os.path.isfile(path) else None
+
+
+@job("prerender_site")
+def prerender_site_job():
+    prerender_site()
+
+
+@app.post("/api/admin/prerender", dependencies=[Depends(require_admin)])
+def trigger_prerender(db: Session = Depends(get_db)):
+    if not PRERENDER_DIR:
+        raise HTTPException(status_code=400, detail="Prerendering is disabled (PRERENDER_DIR not set)")
+    written = prerender_site(db)
+    if not written:
+        raise HTTPException(status_code=500, detail="Frontend build not found; nothing to prerender")
+    return {"message": "Prerendered public pages", "files": written}
+
+
+# ---------------------------------------------------------------------------
+# Request profiling (admin)
+# ---------------------------------------------------------------------------
+@app.get("/api/admin/profiling", response_model=ProfilingSettings, dependencies=[Depends(require_admin)])
+def get_profiling_settings():
+    return request_profiler.load_settings()
+
+
+@app.put("/api/admin/profiling", response_model=ProfilingSettings, dependencies=[Depends(require_admin)])
+def update_profiling_settings(settings: ProfilingSettings):
+    return request_profiler.update_settings(settings)
+
+
+@app.get("/api/admin/profiles", dependencies=[Depends(require_admin)])
+def list_profiles():
+    return request_profiler.recent()
+
+
+@app.get("/api/admin/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+def download_profile(profile_id: int):
+    """Folded stacks, one ``frame;frame;... count`` line per stack (flamegraph.pl, speedscope)."""
+    stacks = request_profiler.stacks(profile_id)
+    if stacks is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return Response(
+        stacks + "\n",
+        media_type="text/plain",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'},
+    )
+
+
 @app.get("/")
-def root(db: Session = Depends(get_db)):
+def root(db: Session = Depends(get_read_db)):
+    prerendered = prerendered_file("")
+    if prerendered:
+        return FileResponse(prerendered, media_type="text/html", headers={"Cache-Control": "no-cache"})
     result = serve_index_with_seo(db)
     if result:
         return result
@@ -874,7 +2762,7 @@ def root(db: Session = Depends(get_db)):
 
 # Catch-all for client-side routing (React Router)
 @app.get("/{full_path:path}")
-def serve_spa(full_path: str, db: Session = Depends(get_db)):
+def serve_spa(full_path: str, db: Session = Depends(get_read_db)):
     # Don't catch API or static routes
     if full_path.startswith("api/") or full_path.startswith("images/") or full_path.startswith("assets/"):
         raise HTTPException(status_code=404, detail="Not found")
@@ -884,6 +2772,10 @@ def serve_spa(full_path: str, db: Session = Depends(get_db)):
     if os.path.isfile(static_file) and not full_path.endswith(".html"):
         return FileResponse(static_file)
 
+    prerendered = prerendered_file(full_path)
+    if prerendered:
+        return FileResponse(prerendered, media_type="text/html", headers={"Cache-Control": "no-cache"})
+
     result = serve_index_with_seo(db)
     if result:
         return result
@@ -893,8 +2785,15 @@ def serve_spa(full_path: str, db: Session = Depends(get_db)):
 
 # ---------------------------------------------------------------------------
 # Run with: python main.py   (for development only)
-# Production: uvicorn main:app --host 0.0.0.0 --port $PORT
+# Production: gunicorn -c gunicorn.conf.py main:app   (see gunicorn.conf.py)
+# Prerender:  python main.py prerender   (needs PRERENDER_DIR and a frontend build)
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    if sys.argv[1:] == ["prerender"]:
+        init_database()
+        written = prerender_site()
+        print("\n".join(written) if written else "Nothing prerendered (is PRERENDER_DIR set and the frontend built?)")
+        sys.exit(0 if written else 1)
+
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
@@ -1,6 +1,6 @@
 import { BrowserRouter as Router, Routes, Route } from 'react-router-dom'
 import { useState, useEffect } from 'react'
-import axios from 'axios'
+import { fetchPageContent } from './initialState'
 import { FaInstagram, FaFacebook, FaTwitter, FaYoutube, FaTiktok, FaLinkedin, FaPinterest, FaSnapchat, FaLink } from 'react-icons/fa'
 import Navigation from './components/Navigation'
 import Home from './pages/Home'
@@ -20,8 +20,7 @@ function App() {
 
   const fetchSocialMedia = async () => {
     try {
-      const response = await axios.get('/api/content/social_media')
-      setSocialMedia(JSON.parse(response.data.content))
+      setSocialMedia(await fetchPageContent('social_media'))
     } catch (error) {
       console.error('Error fetching social media:', error)
     }
@@ -0,0 +1,26 @@
+import axios from 'axios'
+
+// Data embedded in prerendered pages by the backend (window.__INITIAL_STATE__).
+// Each value is handed out once, so later visits to a page fetch fresh data.
+export function takeInitialState(...path) {
+  let parent = window.__INITIAL_STATE__
+  for (const key of path.slice(0, -1)) {
+    parent = parent && parent[key]
+  }
+  const last = path[path.length - 1]
+  if (!parent || !(last in parent)) {
+    return undefined
+  }
+  const value = parent[last]
+  delete parent[last]
+  return value
+}
+
+export async function fetchPageContent(page) {
+  const embedded = takeInitialState('content', page)
+  if (embedded) {
+    return embedded
+  }
+  const response = await axios.get(`/api/content/${page}`)
+  return response.data.parsed
+}
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react'
-import axios from 'axios'
+import { fetchPageContent } from '../initialState'
 import { FaMobileAlt } from 'react-icons/fa'
 import './About.css'
 
@@ -24,8 +24,7 @@ function About() {
 
   const fetchContent = async () => {
     try {
-      const response = await axios.get('/api/content/about')
-      const parsedContent = JSON.parse(response.data.content)
+      const parsedContent = await fetchPageContent('about')
       setContent(parsedContent)
     } catch (error) {
       console.error('Error fetching about content:', error)
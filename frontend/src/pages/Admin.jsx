@@ -128,10 +128,10 @@ function Admin() {
         api.get('/api/waiting-list')
       ])
 
-      setHomeContent(JSON.parse(homeRes.data.content))
-      setCareContent(JSON.parse(careRes.data.content))
-      setAboutContent(JSON.parse(aboutRes.data.content))
-      setSocialMediaContent(JSON.parse(socialRes.data.content))
+      setHomeContent(homeRes.data.parsed)
+      setCareContent(careRes.data.parsed)
+      setAboutContent(aboutRes.data.parsed)
+      setSocialMediaContent(socialRes.data.parsed)
       setKittens(kittensRes.data)
       setParents(parentsRes.data)
       setProducts(productsRes.data)
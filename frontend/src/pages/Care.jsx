@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react'
-import axios from 'axios'
+import { fetchPageContent } from '../initialState'
 import './Care.css'
 
 function Care() {
@@ -18,8 +18,7 @@ function Care() {
 
   const fetchContent = async () => {
     try {
-      const response = await axios.get('/api/content/care')
-      const parsedContent = JSON.parse(response.data.content)
+      const parsedContent = await fetchPageContent('care')
       setContent(parsedContent)
     } catch (error) {
       console.error('Error fetching care content:', error)
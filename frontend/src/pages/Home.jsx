@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { Link } from 'react-router-dom'
-import axios from 'axios'
+import { fetchPageContent } from '../initialState'
 import './Home.css'
 
 function Home() {
@@ -20,8 +20,7 @@ function Home() {
 
   const fetchContent = async () => {
     try {
-      const response = await axios.get('/api/content/home')
-      const parsedContent = JSON.parse(response.data.content)
+      const parsedContent = await fetchPageContent('home')
       setContent(parsedContent)
     } catch (error) {
       console.error('Error fetching home content:', error)
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import axios from 'axios'
+import { takeInitialState, fetchPageContent } from '../initialState'
 import './Kittens.css'
 
 function Kittens() {
@@ -19,18 +20,37 @@ function Kittens() {
   useEffect(() => {
     document.title = 'Available Abyssinian Kittens for Sale | Royal Abyssinians'
     fetchData()
+
+    // Live availability updates pushed by the backend (see /api/kittens/events)
+    const events = new EventSource('/api/kittens/events')
+    const upsertKitten = (e) => {
+      const kitten = JSON.parse(e.data)
+      setKittens(prev => {
+        const exists = prev.some(k => k.id === kitten.id)
+        return exists ? prev.map(k => (k.id === kitten.id ? kitten : k)) : [...prev, kitten]
+      })
+    }
+    events.addEventListener('kitten.created', upsertKitten)
+    events.addEventListener('kitten.updated', upsertKitten)
+    events.addEventListener('kitten.deleted', (e) => {
+      const { id } = JSON.parse(e.data)
+      setKittens(prev => prev.filter(k => k.id !== id))
+    })
+    events.addEventListener('resync', () => fetchData())
+    return () => events.close()
   }, [])
 
   const fetchData = async () => {
     try {
-      const [kittensRes, parentsRes, aboutRes] = await Promise.all([
-        axios.get('/api/kittens'),
-        axios.get('/api/parents'),
-        axios.get('/api/content/about')
+      const embeddedKittens = takeInitialState('kittens')
+      const embeddedParents = takeInitialState('parents')
+      const [kittensData, parentsData, aboutContent] = await Promise.all([
+        embeddedKittens || axios.get('/api/kittens').then(res => res.data),
+        embeddedParents || axios.get('/api/parents').then(res => res.data),
+        fetchPageContent('about')
       ])
-      setKittens(kittensRes.data)
-      setParents(parentsRes.data)
-      const aboutContent = JSON.parse(aboutRes.data.content)
+      setKittens(kittensData)
+      setParents(parentsData)
       setPaymentMethods(aboutContent.payment_methods || [])
     } catch (error) {
       console.error('Error fetching data:', error)